@@ -12,6 +12,10 @@ class PlayerInsightEngine:
             'field_goal_percentage', 'three_point_percentage'
         ]
 
+    def _present_columns(self, player_stats: pd.DataFrame) -> List[str]:
+        """Return the tracked stat columns present in the frame, in tracking order."""
+        return [col for col in self._stats_columns if col in player_stats.columns]
+
     def normalize_stats(self, stats_df: pd.DataFrame) -> pd.DataFrame:
         """Normalize player statistics using StandardScaler."""
         normalized_stats = stats_df.copy()
@@ -26,13 +30,12 @@ class PlayerInsightEngine:
         window_size: int = 5
     ) -> Dict[str, float]:
         """Calculate recent performance trends using rolling averages."""
-        trends = {}
-        for col in self._stats_columns:
-            if col in player_stats.columns:
-                current_avg = player_stats[col].tail(window_size).mean()
-                previous_avg = player_stats[col].tail(window_size * 2).head(window_size).mean()
-                trends[col] = ((current_avg - previous_avg) / previous_avg) * 100
-        return trends
+        stats = player_stats[self._present_columns(player_stats)]
+        # Average every stat column at once instead of one column at a time
+        current_avg = stats.tail(window_size).mean()
+        previous_avg = stats.tail(window_size * 2).head(window_size).mean()
+        trends = ((current_avg - previous_avg) / previous_avg) * 100
+        return trends.to_dict()
 
     def _calculate_weighted_skill_score(
         self,
@@ -106,13 +109,15 @@ class PlayerInsightEngine:
         percentile_threshold: float = 25
     ) -> List[str]:
         """Identify areas where a player needs improvement."""
-        growth_areas = []
-        for col in self._stats_columns:
-            if col in player_stats.columns:
-                percentile = np.percentile(player_stats[col], percentile_threshold)
-                if player_stats[col].iloc[-1] <= percentile:
-                    growth_areas.append(col)
-        return growth_areas
+        columns = self._present_columns(player_stats)
+        if not columns:
+            return []
+
+        values = player_stats[columns].to_numpy(dtype=float)
+        # One percentile pass over the (games x stats) matrix
+        percentiles = np.percentile(values, percentile_threshold, axis=0)
+        needs_work = values[-1] <= percentiles
+        return [col for col, flag in zip(columns, needs_work) if flag]
 
     def calculate_win_rate(
         self,
@@ -120,9 +125,7 @@ class PlayerInsightEngine:
         time_period: Optional[timedelta] = None
     ) -> float:
         """Calculate player's win rate for a given time period."""
-        if time_period:
-            cutoff_date = datetime.now() - time_period
-            player_stats = player_stats[player_stats['game_date'] >= cutoff_date]
+        player_stats = self._games_in_period(player_stats, time_period)
         
         total_games = len(player_stats)
         if total_games == 0:
@@ -131,6 +134,33 @@ class PlayerInsightEngine:
         wins = len(player_stats[player_stats['result'] == 'win'])
         return (wins / total_games) * 100
 
+    def calculate_win_rates(
+        self,
+        player_stats: pd.DataFrame,
+        time_period: Optional[timedelta] = None
+    ) -> pd.Series:
+        """Calculate every player's win rate in one grouped pass, indexed by player_id.
+
+        Uses the same rule as calculate_win_rate; players with no games in the
+        period get 0.
+        """
+        recent_games = self._games_in_period(player_stats, time_period)
+        win_rates = (recent_games['result'] == 'win').groupby(
+            recent_games['player_id']
+        ).mean() * 100
+        return win_rates.reindex(player_stats['player_id'].unique(), fill_value=0.0)
+
+    def _games_in_period(
+        self,
+        player_stats: pd.DataFrame,
+        time_period: Optional[timedelta]
+    ) -> pd.DataFrame:
+        """Keep only the games played within time_period of now."""
+        if time_period:
+            cutoff_date = datetime.now() - time_period
+            player_stats = player_stats[player_stats['game_date'] >= cutoff_date]
+        return player_stats
+
     def generate_player_report(
         self,
         player_stats: pd.DataFrame
@@ -26,6 +26,62 @@ import markdown
 import emoji
 from jinja2 import Template
 
+# HTML template for web UI; compiled once at import and shared by all assistants
+_WEB_TEMPLATE = Template("""
+    <div class="coach-response">
+        <div class="response-header">
+            <h3>{{ title }}</h3>
+            <div class="confidence">Confidence: {{ confidence }}%</div>
+        </div>
+        
+        <div class="response-body">
+            {{ content | safe }}
+            
+            {% if drills %}
+            <div class="recommended-drills">
+                <h4>Recommended Drills:</h4>
+                <ul>
+                {% for drill in drills %}
+                    <li>
+                        <strong>{{ drill.name }}</strong> ({{ drill.duration }} min)
+                        <p>{{ drill.description }}</p>
+                        {% if drill.videos %}
+                        <div class="video-links">
+                            <strong>Tutorial Videos:</strong>
+                            <ul>
+                            {% for video in drill.videos %}
+                                <li><a href="{{ video.url }}" target="_blank">{{ video.title }}</a></li>
+                            {% endfor %}
+                            </ul>
+                        </div>
+                        {% endif %}
+                    </li>
+                {% endfor %}
+                </ul>
+            </div>
+            {% endif %}
+            
+            {% if stats %}
+            <div class="player-stats">
+                <h4>Your Stats:</h4>
+                {{ stats | safe }}
+            </div>
+            {% endif %}
+        </div>
+        
+        {% if follow_up %}
+        <div class="follow-up">
+            <h4>Suggested Next Steps:</h4>
+            <ul>
+            {% for step in follow_up %}
+                <li>{{ step }}</li>
+            {% endfor %}
+            </ul>
+        </div>
+        {% endif %}
+    </div>
+    """)
+
 class CoachAssistant:
     def __init__(self, api_key: str):
         self.api_key = api_key
@@ -76,61 +132,7 @@ class CoachAssistant:
         # Add video recommendation database
         self.video_db = self._load_video_knowledge()
         
-        # HTML template for web UI
-        self.web_template = Template("""
-        <div class="coach-response">
-            <div class="response-header">
-                <h3>{{ title }}</h3>
-                <div class="confidence">Confidence: {{ confidence }}%</div>
-            </div>
-            
-            <div class="response-body">
-                {{ content | safe }}
-                
-                {% if drills %}
-                <div class="recommended-drills">
-                    <h4>Recommended Drills:</h4>
-                    <ul>
-                    {% for drill in drills %}
-                        <li>
-                            <strong>{{ drill.name }}</strong> ({{ drill.duration }} min)
-                            <p>{{ drill.description }}</p>
-                            {% if drill.videos %}
-                            <div class="video-links">
-                                <strong>Tutorial Videos:</strong>
-                                <ul>
-                                {% for video in drill.videos %}
-                                    <li><a href="{{ video.url }}" target="_blank">{{ video.title }}</a></li>
-                                {% endfor %}
-                                </ul>
-                            </div>
-                            {% endif %}
-                        </li>
-                    {% endfor %}
-                    </ul>
-                </div>
-                {% endif %}
-                
-                {% if stats %}
-                <div class="player-stats">
-                    <h4>Your Stats:</h4>
-                    {{ stats | safe }}
-                </div>
-                {% endif %}
-            </div>
-            
-            {% if follow_up %}
-            <div class="follow-up">
-                <h4>Suggested Next Steps:</h4>
-                <ul>
-                {% for step in follow_up %}
-                    <li>{{ step }}</li>
-                {% endfor %}
-                </ul>
-            </div>
-            {% endif %}
-        </div>
-        """)
+        self.web_template = _WEB_TEMPLATE
 
     def _initialize_tools(self) -> List[Tool]:
         """Initialize tools for the agent to use."""
@@ -367,7 +369,7 @@ class CoachAssistant:
 
     def _format_sms_response(self, response: CoachResponse) -> str:
         """Format response for SMS (brief, concise)."""
-        parts = [response.answer.split('\n')[0]]  # First paragraph only
+        parts = [response.answer.partition('\n')[0]]  # First paragraph only
         
         if response.drills:
             parts.append("\nTry these drills:")
@@ -389,10 +391,11 @@ class CoachAssistant:
         # Format stats if available
         stats_html = None
         if response.stats:
-            stats_html = "<table>"
-            for key, value in response.stats.items():
-                stats_html += f"<tr><td>{key}</td><td>{value}</td></tr>"
-            stats_html += "</table>"
+            rows = "".join(
+                f"<tr><td>{key}</td><td>{value}</td></tr>"
+                for key, value in response.stats.items()
+            )
+            stats_html = f"<table>{rows}</table>"
         
         # Generate follow-up suggestions
         follow_up = [
@@ -531,7 +534,7 @@ class CoachAssistant:
         
         # Update vector store with new player data
         text = f"Player: {stats['name']}\n"
-        text += f"Stats: {json.dumps(stats)}"
+        text += f"Stats: {json.dumps(stats, separators=(',', ':'))}"
         
         self.player_db = FAISS.from_texts(
             [text],
@@ -1,7 +1,6 @@
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import numpy as np
-import openai
 import json
 import logging
 from .player_progress_tracker import PlayerProgressTracker
@@ -283,16 +282,17 @@ class CoachAssistantEngine:
         }
 
         # Extract from question
-        if "strength" in question.lower():
+        question_lower = question.lower()
+        if "strength" in question_lower:
             preferences['goal'] = FitnessGoal.STRENGTH
-        elif "endurance" in question.lower():
+        elif "endurance" in question_lower:
             preferences['goal'] = FitnessGoal.ENDURANCE
-        elif "weight loss" in question.lower():
+        elif "weight loss" in question_lower:
             preferences['goal'] = FitnessGoal.WEIGHT_LOSS
 
-        if "gym" in question.lower():
+        if "gym" in question_lower:
             preferences['type'] = WorkoutType.GYM_BASED
-        elif "hiit" in question.lower():
+        elif "hiit" in question_lower:
             preferences['type'] = WorkoutType.HIIT
 
         # TODO: Extract more preferences from player history
@@ -310,11 +310,12 @@ class CoachAssistantEngine:
         }
 
         # Extract from question
-        if "vegetarian" in question.lower() or "plant" in question.lower():
+        question_lower = question.lower()
+        if "vegetarian" in question_lower or "plant" in question_lower:
             preferences['preference'] = DietaryPreference.PLANT_BASED
-        elif "protein" in question.lower():
+        elif "protein" in question_lower:
             preferences['preference'] = DietaryPreference.HIGH_PROTEIN
-        elif "keto" in question.lower():
+        elif "keto" in question_lower:
             preferences['preference'] = DietaryPreference.KETO
 
         # TODO: Extract more preferences from player history
@@ -334,14 +335,15 @@ class CoachAssistantEngine:
         # TODO: Get actual user location from their profile or device
 
         # Extract from question
-        if "gym" in question.lower():
+        question_lower = question.lower()
+        if "gym" in question_lower:
             preferences['type'] = WorkoutType.GYM_BASED
-        elif "park" in question.lower():
+        elif "park" in question_lower:
             preferences['type'] = WorkoutType.CALISTHENICS
 
-        if "weights" in question.lower():
+        if "weights" in question_lower:
             preferences['equipment'].append("weights")
-        if "pull-up" in question.lower():
+        if "pull-up" in question_lower:
             preferences['equipment'].append("pull-up bar")
 
         return preferences
@@ -51,35 +51,32 @@ class PlayerInsightService:
         # Load player data
         player_data = self._load_player_data()
         
-        # Calculate win rates for all players
-        player_stats = []
-        unique_players = player_data['player_id'].unique()
-        
-        for player_id in unique_players:
-            player_games = player_data[player_data['player_id'] == player_id]
-            win_rate = self.player_engine.calculate_win_rate(
-                player_games,
-                time_period=timedelta(days=time_period_days)
-            )
-            
-            if len(player_games) > 0:
-                latest_game = player_games.iloc[-1]
-                player_stats.append({
-                    'player_id': player_id,
-                    'player_name': latest_game['player_name'],
-                    'win_rate': win_rate,
-                    'games_played': len(player_games),
-                    'avg_points': player_games['points'].mean(),
-                    'avg_assists': player_games['assists'].mean(),
-                    'avg_rebounds': player_games['rebounds'].mean()
-                })
-        
-        # Sort by win rate and get top players
-        return sorted(
-            player_stats,
-            key=lambda x: x['win_rate'],
-            reverse=True
-        )[:limit]
+        # Aggregate every player in one grouped pass instead of filtering per player
+        player_summary = player_data.groupby('player_id', sort=False).agg(
+            player_name=('player_name', 'last'),
+            games_played=('player_name', 'size'),
+            avg_points=('points', 'mean'),
+            avg_assists=('assists', 'mean'),
+            avg_rebounds=('rebounds', 'mean')
+        )
+
+        # Win rate only counts games inside the requested time period
+        player_summary['win_rate'] = self.player_engine.calculate_win_rates(
+            player_data,
+            time_period=timedelta(days=time_period_days)
+        )
+
+        # Get top players by win rate
+        top_players = player_summary.nlargest(limit, 'win_rate').reset_index()
+        return top_players[[
+            'player_id',
+            'player_name',
+            'win_rate',
+            'games_played',
+            'avg_points',
+            'avg_assists',
+            'avg_rebounds'
+        ]].to_dict('records')
 
     def _load_player_data(self) -> pd.DataFrame:
         """Load player statistics from the data source."""
@@ -2,6 +2,7 @@ from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 from enum import Enum
 import math
+from bisect import bisect_right
 import random
 import json
 import logging
@@ -75,6 +76,11 @@ class PlayerProgressionSystem:
             PlayerTier.PRODIGY: {'min_level': 40, 'badges_required': 35},
             PlayerTier.LEGEND: {'min_level': 50, 'badges_required': 50}
         }
+        # (tier, min_level, badges_required) rows so tier checks skip the nested dict lookups
+        self._tier_brackets = tuple(
+            (tier, req['min_level'], req['badges_required'])
+            for tier, req in self.tier_requirements.items()
+        )
         
         # Challenge pool
         self.challenge_pool = self._initialize_challenge_pool()
@@ -141,12 +147,8 @@ class PlayerProgressionSystem:
 
     def get_level_progress(self, total_xp: int) -> Tuple[int, float]:
         """Calculate current level and progress to next level."""
-        current_level = 0
-        for level, threshold in enumerate(self.level_thresholds):
-            if total_xp >= threshold:
-                current_level = level + 1
-            else:
-                break
+        # Thresholds are ascending, so the level is the count of thresholds reached
+        current_level = bisect_right(self.level_thresholds, total_xp)
         
         # Calculate progress to next level
         current_threshold = self.level_thresholds[current_level - 1] if current_level > 0 else 0
@@ -162,9 +164,8 @@ class PlayerProgressionSystem:
         badge_count = self.progress_tracker.get_badge_count(player_id)
         
         current_tier = PlayerTier.ROOKIE
-        for tier, requirements in self.tier_requirements.items():
-            if (current_level >= requirements['min_level'] and 
-                badge_count >= requirements['badges_required']):
+        for tier, min_level, badges_required in self._tier_brackets:
+            if current_level >= min_level and badge_count >= badges_required:
                 current_tier = tier
         
         return current_tier
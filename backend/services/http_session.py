@@ -0,0 +1,30 @@
+from typing import Optional
+import aiohttp
+
+
+class PooledSessionMixin:
+    """Give a service one pooled HTTP session, created lazily inside the event loop.
+
+    Use the service as an async context manager, or await close() on shutdown,
+    so the session is released.
+    """
+
+    _session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, opening it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
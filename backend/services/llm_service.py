@@ -1,6 +1,10 @@
 from typing import Dict, List, Optional, Any, TypedDict, Literal
-import openai
-import json
+import asyncio
+import contextlib
+import os
+import random
+import time
+import orjson
 import logging
 from datetime import datetime, timedelta
 from .response_cache import ResponseCache
@@ -8,6 +12,66 @@ from .media_service import MediaService
 
 logger = logging.getLogger(__name__)
 
+# Caps in-flight OpenAI requests across all service instances in this process;
+# zero or less leaves concurrency unbounded, like the zero rates below
+_max_concurrency = int(os.getenv('OPENAI_MAX_CONCURRENCY', '5'))
+_openai_semaphore = (
+    asyncio.Semaphore(_max_concurrency) if _max_concurrency > 0
+    else contextlib.nullcontext()
+)
+
+class _TokenBucket:
+    """Client-side rate limiter refilled evenly over each minute; a zero rate disables it."""
+
+    def __init__(self, rate_per_minute: int):
+        self.capacity = rate_per_minute
+        self.tokens = float(rate_per_minute)
+        self.refill_per_second = rate_per_minute / 60
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until `amount` units are available, then take them."""
+        if self.capacity <= 0:
+            return
+
+        # A single oversized request would otherwise wait forever
+        amount = min(amount, self.capacity)
+        # Waiters queue on the lock, so they are served in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated_at) * self.refill_per_second
+                )
+                self.updated_at = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.refill_per_second)
+
+# Throttle to the account's tier limits instead of discovering them through 429s
+_request_bucket = _TokenBucket(int(os.getenv('OPENAI_RPM', '0')))
+_token_bucket = _TokenBucket(int(os.getenv('OPENAI_TPM', '0')))
+
+# (epoch second, ISO string) of the last metadata timestamp handed out
+_last_timestamp = (0, "")
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as ISO text, formatting at most once per second."""
+    global _last_timestamp
+    second = int(time.time())
+    if second != _last_timestamp[0]:
+        _last_timestamp = (second, datetime.utcfromtimestamp(second).isoformat())
+    return _last_timestamp[1]
+
+def _retryable_errors() -> tuple:
+    """Transient failures worth retrying; anything else goes straight to the fallback response."""
+    # Imported here rather than at module level; the openai SDK is slow to import
+    from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+    return (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
 class MediaItem(TypedDict):
     type: Literal['video', 'image', 'animation', '3d_model']
     url: str
@@ -32,14 +96,20 @@ class LLMService:
         self,
         config: Dict[str, Any],
         response_cache: ResponseCache,
-        media_service: MediaService
+        media_service: MediaService,
+        llm_client: Optional[Any] = None
     ):
-        """Initialize the LLM service with configuration and services."""
+        """Initialize the LLM service with configuration and services.
+
+        Pass llm_client to supply a preconfigured (or fake) AsyncOpenAI-compatible client.
+        """
         self.config = config
         self.cache = response_cache
         self.media_service = media_service
         self.model = config.get('model', 'gpt-4')
-        openai.api_key = config['openai_api_key']
+        self._client = llm_client  # Built on first request by _get_client if not injected
+        self.max_attempts = config.get('openai_max_attempts', 3)
+        self.retry_base_delay = config.get('openai_retry_base_delay', 0.5)
         
         # Response configuration with media support
         self.response_config = {
@@ -98,7 +168,7 @@ class LLMService:
             )
 
             # Make API call with structured output instruction
-            response = await openai.ChatCompletion.acreate(
+            response = await self._create_chat_completion(
                 model=self.model,
                 messages=messages,
                 temperature=config['temperature'],
@@ -106,47 +176,15 @@ class LLMService:
                 top_p=0.9,
                 frequency_penalty=0.5,
                 presence_penalty=0.5,
-                response_format={
-                    "type": "json_object",
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "response": {"type": "string"},
-                            "recommendations": {
-                                "type": "array",
-                                "items": {"type": "string"}
-                            },
-                            "suggested_drills": {
-                                "type": "array",
-                                "items": {"type": "object"}
-                            },
-                            "media_requests": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "type": {"type": "string"},
-                                        "subject": {"type": "string"},
-                                        "description": {"type": "string"},
-                                        "tags": {
-                                            "type": "array",
-                                            "items": {"type": "string"}
-                                        }
-                                    }
-                                }
-                            },
-                            "tags": {
-                                "type": "array",
-                                "items": {"type": "string"}
-                            }
-                        }
-                    }
-                }
+                # JSON mode; the expected fields are spelled out in the system prompt
+                response_format={"type": "json_object"}
             )
 
             # Parse and structure the response
             if response.choices and response.choices[0].message:
-                llm_response = json.loads(response.choices[0].message.content)
+                llm_response = self._parse_llm_response(
+                    response.choices[0].message.content
+                )
                 
                 # Fetch relevant media content
                 media_items = await self._fetch_media_content(
@@ -163,10 +201,10 @@ class LLMService:
                     tags=llm_response.get('tags', []),
                     context_used=self._get_relevant_context(
                         context,
-                        llm_response['tags']
+                        llm_response.get('tags', [])
                     ),
                     metadata={
-                        'timestamp': datetime.utcnow().isoformat(),
+                        'timestamp': _utc_timestamp(),
                         'response_type': response_type,
                         'model_used': self.model,
                         'player_id': player_id,
@@ -198,42 +236,101 @@ class LLMService:
                 metadata={'error': str(e)}
             )
 
+    def _get_client(self) -> Any:
+        """Return the OpenAI client, creating it on first use."""
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(
+                api_key=self.config['openai_api_key'],
+                max_retries=0,  # Retries are handled by _create_chat_completion
+                timeout=30
+            )
+        return self._client
+
+    def _estimate_tokens(self, request: Dict[str, Any]) -> int:
+        """Roughly estimate the tokens a request counts against TPM (about 4 chars per token)."""
+        prompt_chars = sum(len(m.get('content') or '') for m in request.get('messages', []))
+        return prompt_chars // 4 + request.get('max_tokens', 0)
+
+    async def _create_chat_completion(self, **kwargs) -> Any:
+        """Call the chat completion API, retrying transient failures with backoff."""
+        for attempt in range(self.max_attempts):
+            await _request_bucket.acquire()
+            await _token_bucket.acquire(self._estimate_tokens(kwargs))
+            try:
+                async with _openai_semaphore:
+                    return await self._get_client().chat.completions.create(**kwargs)
+            except _retryable_errors() as e:
+                if attempt == self.max_attempts - 1:
+                    raise
+
+                # Sleep outside the semaphore so other requests can use the slot
+                delay = self.retry_base_delay * 2 ** attempt + random.random() * 0.1
+                logger.warning(
+                    f"OpenAI request failed ({type(e).__name__}), "
+                    f"retrying in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+
+    def _parse_llm_response(self, content: str) -> Dict[str, Any]:
+        """Parse the JSON-mode completion, keeping the raw text if it is malformed."""
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            logger.warning("LLM returned malformed JSON, using raw text as the response")
+            return {'response': content}
+
     async def _fetch_media_content(
         self,
         media_requests: List[Dict[str, Any]],
         context: Dict[str, Any]
     ) -> List[MediaItem]:
         """Fetch or generate relevant media content based on LLM suggestions."""
-        media_items = []
-        
-        for request in media_requests:
-            try:
-                # Search for existing media content
-                media = await self.media_service.search_media(
-                    media_type=request['type'],
-                    subject=request['subject'],
-                    tags=request['tags']
-                )
+        # Requests are independent, so resolve them concurrently
+        results = await asyncio.gather(*(
+            self._fetch_media_for_request(request, context)
+            for request in media_requests
+        ))
 
-                if media:
-                    # Use existing media
-                    media_items.extend(media)
-                else:
-                    # Generate new media if supported
-                    generated_media = await self.media_service.generate_media(
-                        media_type=request['type'],
-                        description=request['description'],
-                        context=context
-                    )
-                    if generated_media:
-                        media_items.append(generated_media)
-
-            except Exception as e:
-                logger.error(f"Error fetching media content: {str(e)}")
-                continue
+        media_items = []
+        for media in results:
+            media_items.extend(media)
 
         return media_items
 
+    async def _fetch_media_for_request(
+        self,
+        request: Dict[str, Any],
+        context: Dict[str, Any]
+    ) -> List[MediaItem]:
+        """Search for media matching a single request, generating it if none exists."""
+        try:
+            # Search for existing media content
+            media = await self.media_service.search_media(
+                media_type=request['type'],
+                subject=request['subject'],
+                tags=request['tags']
+            )
+
+            if media:
+                # Use existing media
+                return media
+
+            # Generate new media if supported
+            generated_media = await self.media_service.generate_media(
+                media_type=request['type'],
+                description=request['description'],
+                context=context
+            )
+            if generated_media:
+                return [generated_media]
+
+        except Exception as e:
+            logger.error(f"Error fetching media content: {str(e)}")
+
+        return []
+
     def _build_enhanced_prompt(
         self,
         question: str,
@@ -418,14 +515,16 @@ class LLMService:
 
     def _format_response(self, raw_response: str, context: Dict[str, Any]) -> str:
         """Format and enhance the LLM response with additional context."""
+        parts = [raw_response]
+
         # Add challenge progress if relevant
         if context.get('active_challenges'):
-            raw_response += "\n\nActive Challenges Progress:"
+            parts.append("\n\nActive Challenges Progress:")
             for challenge in context['active_challenges']:
-                raw_response += f"\n- {challenge['title']}: {challenge['progress']}% complete"
+                parts.append(f"\n- {challenge['title']}: {challenge['progress']}% complete")
 
         # Add XP earned if available
         if context.get('recent_xp'):
-            raw_response += f"\n\nXP Earned Today: {context['recent_xp']}"
+            parts.append(f"\n\nXP Earned Today: {context['recent_xp']}")
 
-        return raw_response 
\ No newline at end of file
+        return "".join(parts)
\ No newline at end of file
@@ -1,15 +1,15 @@
 from typing import Dict, List, Optional, Any, TypedDict, Literal
-import aiohttp
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
 import boto3
 from botocore.exceptions import ClientError
+from .http_session import PooledSessionMixin
 
 logger = logging.getLogger(__name__)
 
-class MediaService:
+class MediaService(PooledSessionMixin):
     def __init__(self, config: Dict[str, Any]):
         """Initialize the media service with configuration."""
         self.config = config
@@ -129,31 +129,31 @@ class MediaService:
         """Generate an image using DALL-E or similar service."""
         try:
             # Call DALL-E API to generate image
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    "https://api.openai.com/v1/images/generations",
-                    headers={
-                        "Authorization": f"Bearer {self.config['openai_api_key']}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "prompt": description,
-                        "n": 1,
-                        "size": "1024x1024",
-                        "response_format": "url"
-                    }
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        image_url = data['data'][0]['url']
-                        
-                        # Download and store the image
-                        return await self._store_generated_media(
-                            media_type='image',
-                            url=image_url,
-                            description=description,
-                            context=context
-                        )
+            session = self._get_session()
+            async with session.post(
+                "https://api.openai.com/v1/images/generations",
+                headers={
+                    "Authorization": f"Bearer {self.config['openai_api_key']}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "prompt": description,
+                    "n": 1,
+                    "size": "1024x1024",
+                    "response_format": "url"
+                }
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    image_url = data['data'][0]['url']
+                    
+                    # Download and store the image
+                    return await self._store_generated_media(
+                        media_type='image',
+                        url=image_url,
+                        description=description,
+                        context=context
+                    )
 
             return None
 
@@ -171,39 +171,39 @@ class MediaService:
         """Store generated media in S3 and return metadata."""
         try:
             # Download media from URL
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        content = await response.read()
-                        
-                        # Generate unique filename
-                        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-                        filename = f"{context.get('player_id')}_{timestamp}"
-                        extension = self.media_config[media_type]['allowed_formats'][0]
-                        key = f"{self.media_config[media_type]['base_path']}{filename}.{extension}"
-                        
-                        # Upload to S3
-                        self.s3_client.put_object(
-                            Bucket=self.media_bucket,
-                            Key=key,
-                            Body=content,
-                            ContentType=f"{media_type}/{extension}",
-                            Metadata={
-                                'caption': description,
-                                'tags': json.dumps(context.get('tags', [])),
-                                'player_id': context.get('player_id', ''),
-                                'generated': 'true'
-                            }
-                        )
-                        
-                        return {
-                            'type': media_type,
-                            'url': f"{self.cdn_base_url}/{key}",
+            session = self._get_session()
+            async with session.get(url) as response:
+                if response.status == 200:
+                    content = await response.read()
+                    
+                    # Generate unique filename
+                    timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+                    filename = f"{context.get('player_id')}_{timestamp}"
+                    extension = self.media_config[media_type]['allowed_formats'][0]
+                    key = f"{self.media_config[media_type]['base_path']}{filename}.{extension}"
+                    
+                    # Upload to S3
+                    self.s3_client.put_object(
+                        Bucket=self.media_bucket,
+                        Key=key,
+                        Body=content,
+                        ContentType=f"{media_type}/{extension}",
+                        Metadata={
                             'caption': description,
-                            'thumbnail_url': None,
-                            'format': extension,
-                            'tags': context.get('tags', [])
+                            'tags': json.dumps(context.get('tags', [])),
+                            'player_id': context.get('player_id', ''),
+                            'generated': 'true'
                         }
+                    )
+                    
+                    return {
+                        'type': media_type,
+                        'url': f"{self.cdn_base_url}/{key}",
+                        'caption': description,
+                        'thumbnail_url': None,
+                        'format': extension,
+                        'tags': context.get('tags', [])
+                    }
 
             return None
 
@@ -1,6 +1,7 @@
 from typing import Dict, Optional
-import json
+import orjson
 import hashlib
+import time
 from datetime import datetime, timedelta
 import redis
 import logging
@@ -8,11 +9,14 @@ import logging
 logger = logging.getLogger(__name__)
 
 class ResponseCache:
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(self, redis_client: redis.Redis, cache_version: str = "v1"):
         self.redis = redis_client
         self.default_ttl = 60 * 60 * 24  # 24 hours
-        self.cache_prefix = "llm_response:"
+        # Bump the version when prompts or response shape change to orphan old entries
+        self.cache_version = cache_version
+        self.cache_prefix = f"llm_response:{cache_version}:"
         self.context_window = 3  # Number of previous messages to include in cache key
+        self.freshness_window = 60 * 60 * 24  # Entries older than a day are not served
 
     def get_cached_response(
         self,
@@ -26,12 +30,12 @@ class ResponseCache:
 
         if cached_data:
             try:
-                cached_response = json.loads(cached_data)
+                cached_response = orjson.loads(cached_data)
                 # Check if the cache entry is still valid based on context
                 if self._validate_cache_entry(cached_response, context):
                     logger.info(f"Cache hit for player {player_id}")
                     return cached_response['response']
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.error("Failed to decode cached response")
                 self.redis.delete(cache_key)
 
@@ -51,6 +55,8 @@ class ResponseCache:
         cache_data = {
             'response': response,
             'timestamp': datetime.utcnow().isoformat(),
+            # Epoch seconds, not monotonic time: entries are shared across processes
+            'fresh_until': time.time() + self.freshness_window,
             'context': context or {},
             'question': question,
             'player_id': player_id
@@ -60,7 +66,7 @@ class ResponseCache:
             self.redis.setex(
                 cache_key,
                 ttl or self.default_ttl,
-                json.dumps(cache_data)
+                orjson.dumps(cache_data, option=orjson.OPT_NON_STR_KEYS)
             )
             logger.info(f"Cached response for player {player_id}")
         except Exception as e:
@@ -80,27 +86,21 @@ class ResponseCache:
         question: str,
         context: Optional[Dict]
     ) -> str:
-        """Generate a cache key based on player ID, question, and context."""
+        """Generate a cache key from the player ID and a digest of question and context."""
         # Normalize the question (lowercase, remove extra whitespace)
         normalized_question = " ".join(question.lower().split())
 
-        # Create a context hash if context exists
-        context_hash = ""
-        if context:
-            # Sort context keys for consistent hashing
-            context_str = json.dumps(context, sort_keys=True)
-            context_hash = hashlib.md5(context_str.encode()).hexdigest()[:8]
-
-        # Combine components to create the key
-        key_components = [
-            self.cache_prefix,
-            player_id,
-            hashlib.md5(normalized_question.encode()).hexdigest()[:16]
-        ]
-        if context_hash:
-            key_components.append(context_hash)
+        # Hash question and context together so equivalent inputs share one entry;
+        # sort keys for consistent hashing
+        payload = orjson.dumps(
+            {'question': normalized_question, 'context': context or {}},
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+        digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
 
-        return ":".join(key_components)
+        # Keep the player ID in the key so invalidate_cache can match by prefix
+        return f"{self.cache_prefix}{player_id}:{digest}"
 
     def _validate_cache_entry(
         self,
@@ -108,6 +108,10 @@ class ResponseCache:
         current_context: Optional[Dict]
     ) -> bool:
         """Validate if a cached entry is still relevant given the current context."""
+        # Check freshness first; a float compare is cheaper than the context checks
+        if time.time() > cached_data.get('fresh_until', 0):
+            return False
+
         if not current_context:
             return True
 
@@ -121,14 +125,6 @@ class ResponseCache:
                 if current_context[field] != cached_context[field]:
                     return False
 
-        # Check timestamp for freshness
-        try:
-            cached_time = datetime.fromisoformat(cached_data['timestamp'])
-            if datetime.utcnow() - cached_time > timedelta(days=1):
-                return False
-        except (KeyError, ValueError):
-            return False
-
         return True
 
     def get_similar_questions(
@@ -143,7 +139,7 @@ class ResponseCache:
 
         for key in self.redis.scan_iter(pattern):
             try:
-                cached_data = json.loads(self.redis.get(key))
+                cached_data = orjson.loads(self.redis.get(key))
                 cached_question = cached_data.get('question', '')
                 
                 # Calculate similarity score (simple word overlap for now)
@@ -155,7 +151,7 @@ class ResponseCache:
                         'similarity': similarity,
                         'timestamp': cached_data.get('timestamp')
                     })
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 continue
 
         # Sort by similarity and return top results
@@ -187,13 +183,13 @@ class ResponseCache:
 
         for key in self.redis.scan_iter(pattern):
             try:
-                cached_data = json.loads(self.redis.get(key))
+                cached_data = orjson.loads(self.redis.get(key))
                 timestamp = datetime.fromisoformat(cached_data['timestamp'])
                 
                 if timestamp > cutoff_time:
                     question = cached_data['question']
                     question_counts[question] = question_counts.get(question, 0) + 1
-            except (json.JSONDecodeError, KeyError, ValueError):
+            except (orjson.JSONDecodeError, KeyError, ValueError):
                 continue
 
         # Sort by frequency and return top results
@@ -2,14 +2,14 @@ from typing import Dict, List, Optional
 import os
 import json
 from datetime import datetime, timedelta
-import aiohttp
 import redis
 from geohash import encode as geohash_encode
 import logging
+from .http_session import PooledSessionMixin
 
 logger = logging.getLogger(__name__)
 
-class VenueService:
+class VenueService(PooledSessionMixin):
     def __init__(self, redis_client: redis.Redis):
         self.mapbox_token = os.getenv('MAPBOX_ACCESS_TOKEN')
         self.redis_client = redis_client
@@ -76,14 +76,14 @@ class VenueService:
             f"&access_token={self.mapbox_token}"
         )
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._parse_mapbox_response(data)
-                else:
-                    logger.error(f"Mapbox API error: {response.status}")
-                    return []
+        session = self._get_session()
+        async with session.get(url) as response:
+            if response.status == 200:
+                data = await response.json()
+                return self._parse_mapbox_response(data)
+            else:
+                logger.error(f"Mapbox API error: {response.status}")
+                return []
 
     def _get_mapbox_category(self, venue_type: str) -> str:
         """Map venue types to Mapbox categories."""
@@ -167,21 +167,21 @@ class VenueService:
         )
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data['features']:
-                            details = self._parse_venue_details(data['features'][0])
-                            
-                            # Cache the details
-                            self.redis_client.setex(
-                                cache_key,
-                                self.cache_ttl,
-                                json.dumps(details)
-                            )
-                            
-                            return details
+            session = self._get_session()
+            async with session.get(url) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if data['features']:
+                        details = self._parse_venue_details(data['features'][0])
+                        
+                        # Cache the details
+                        self.redis_client.setex(
+                            cache_key,
+                            self.cache_ttl,
+                            json.dumps(details)
+                        )
+                        
+                        return details
         except Exception as e:
             logger.error(f"Error fetching venue details: {str(e)}")
             return None
@@ -1,10 +1,41 @@
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime, time
+import functools
+import heapq
+from bisect import bisect_left
 import math
 from enum import Enum
+from types import MappingProxyType
+import numpy as np
+from scipy.spatial import cKDTree
 
-class WorkoutType(Enum):
+EARTH_RADIUS_M = 6371000  # Earth's radius in meters
+_DEG2RAD = math.pi / 180.0  # Same factor math.radians uses, without the call overhead
+
+def _make_distance_fn(lat: float, lng: float) -> Callable[..., np.ndarray]:
+    """Build a Haversine distance function (meters) specialized to one origin in degrees.
+
+    The origin's radians and cosine are bound once; the returned function takes target
+    latitudes/longitudes in radians plus the cosines of their latitudes, as NumPy arrays.
+    """
+    phi1 = lat * _DEG2RAD
+    lambda1 = lng * _DEG2RAD
+    cos_phi1 = math.cos(phi1)
+
+    def distance_to(lats_rad: np.ndarray, lngs_rad: np.ndarray, cos_lats: np.ndarray) -> np.ndarray:
+        sin_half_phi = np.sin((lats_rad - phi1) * 0.5)
+        sin_half_lambda = np.sin((lngs_rad - lambda1) * 0.5)
+        a = sin_half_phi * sin_half_phi + \
+            cos_phi1 * cos_lats * sin_half_lambda * sin_half_lambda
+
+        c = 2 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+        return EARTH_RADIUS_M * c
+
+    return distance_to
+
+# str-backed so the database and feature-map lookups keyed by these hash at C speed
+class WorkoutType(str, Enum):
     CALISTHENICS = "calisthenics"
     GYM_BASED = "gym_based"
     HIIT = "hiit"
@@ -12,7 +43,7 @@ class WorkoutType(Enum):
     CARDIO = "cardio"
     FLEXIBILITY = "flexibility"
 
-class DietaryPreference(Enum):
+class DietaryPreference(str, Enum):
     BALANCED = "balanced"
     PLANT_BASED = "plant_based"
     HIGH_PROTEIN = "high_protein"
@@ -26,48 +57,169 @@ class FitnessGoal(Enum):
     ATHLETIC_PERFORMANCE = "athletic_performance"
     MUSCLE_GAIN = "muscle_gain"
 
-@dataclass
+# Venue features that suit each workout type, used to rank venue relevance
+_WORKOUT_TYPE_FEATURES: Dict[WorkoutType, FrozenSet[str]] = {
+    WorkoutType.CALISTHENICS: frozenset({"outdoor", "calisthenics-friendly", "free"}),
+    WorkoutType.GYM_BASED: frozenset({"indoor", "equipment-rich", "climate-controlled"}),
+    WorkoutType.HIIT: frozenset({"open space", "climate-controlled", "equipment-optional"}),
+    WorkoutType.STRENGTH: frozenset({"equipment-rich", "weights-available"}),
+    WorkoutType.CARDIO: frozenset({"running-track", "cardio-equipment", "open space"}),
+    WorkoutType.FLEXIBILITY: frozenset({"quiet", "spacious", "climate-controlled"})
+}
+
+# Exercise intensity levels as array indices, with per-level lookup tables
+_INTENSITY_CODES = {"low": 0, "moderate": 1, "high": 2}
+_INTENSITY_SCORES = np.array([1, 2, 3], dtype=np.float64)
+_INTENSITY_CALORIES_PER_MINUTE = np.array([3, 5, 7], dtype=np.float64)
+
+@dataclass(slots=True, frozen=True)
 class Exercise:
     name: str
     sets: Optional[int]
     reps: Optional[int]
     duration: Optional[int]  # in seconds
-    equipment: List[str]
+    equipment: Tuple[str, ...]
     description: str
     intensity: str
     rest_period: int  # in seconds
-
-@dataclass
+    # Hashed copy of equipment for subset checks against a user's available equipment
+    _equipment_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    # Index of intensity into the _INTENSITY_* tables
+    _intensity_code: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen dataclass: normalized and derived fields have to bypass the generated
+        # __setattr__; containers are made immutable since records are shared
+        object.__setattr__(self, 'equipment', tuple(self.equipment))
+        object.__setattr__(self, '_equipment_set', frozenset(self.equipment))
+        object.__setattr__(self, '_intensity_code', _INTENSITY_CODES[self.intensity])
+
+@dataclass(slots=True, frozen=True)
 class Meal:
     name: str
-    ingredients: List[str]
-    macros: Dict[str, float]  # protein, carbs, fats in grams
+    ingredients: Tuple[str, ...]
+    macros: Mapping[str, float]  # protein, carbs, fats in grams
     calories: int
     preparation_time: int  # in minutes
-    dietary_tags: List[str]
+    dietary_tags: Tuple[str, ...]
+
+    def __post_init__(self):
+        object.__setattr__(self, 'ingredients', tuple(self.ingredients))
+        object.__setattr__(self, 'macros', MappingProxyType(dict(self.macros)))
+        object.__setattr__(self, 'dietary_tags', tuple(self.dietary_tags))
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkoutLocation:
     name: str
     venue_type: str
     latitude: float
     longitude: float
-    equipment: List[str]
+    equipment: Tuple[str, ...]
     distance: float  # in meters
-    open_hours: Dict[str, Tuple[time, time]]
-    features: List[str]
+    open_hours: Mapping[str, Tuple[time, time]]
+    features: Tuple[str, ...]
     rating: float
+    # Hashed copies of equipment/features for subset and overlap checks
+    _equipment_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _feature_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'equipment', tuple(self.equipment))
+        object.__setattr__(self, 'open_hours', MappingProxyType(dict(self.open_hours)))
+        object.__setattr__(self, 'features', tuple(self.features))
+        object.__setattr__(self, '_equipment_set', frozenset(self.equipment))
+        object.__setattr__(self, '_feature_set', frozenset(self.features))
+
+def _to_unit_vectors(phi: np.ndarray, lam: np.ndarray, cos_phi: np.ndarray) -> np.ndarray:
+    """Convert latitudes/longitudes in radians to 3D points on the unit sphere."""
+    return np.column_stack((cos_phi * np.cos(lam), cos_phi * np.sin(lam), np.sin(phi)))
+
+class VenueTable:
+    """Venues stored column by column (parallel arrays) for fast location queries."""
+
+    def __init__(self, venues: Sequence[WorkoutLocation]):
+        count = len(venues)
+        self.names = [venue.name for venue in venues]
+        self.venue_types = [venue.venue_type for venue in venues]
+        self.lats = np.fromiter((venue.latitude for venue in venues), dtype=np.float64, count=count)
+        self.lngs = np.fromiter((venue.longitude for venue in venues), dtype=np.float64, count=count)
+        self.ratings = np.fromiter((venue.rating for venue in venues), dtype=np.float64, count=count)
+        self.equipment = [venue.equipment for venue in venues]
+        self.features = [venue.features for venue in venues]
+        self.equipment_sets = [venue._equipment_set for venue in venues]
+        self.feature_sets = [venue._feature_set for venue in venues]
+        self.open_hours = [venue.open_hours for venue in venues]
+
+        # Radians and latitude cosines are fixed per venue, so convert them once here
+        self.lat_rad = self.lats * _DEG2RAD
+        self.lng_rad = self.lngs * _DEG2RAD
+        self.cos_lat = np.cos(self.lat_rad)
+
+        # Spatial index over venue positions on the unit sphere for radius queries
+        self._index = cKDTree(_to_unit_vectors(self.lat_rad, self.lng_rad, self.cos_lat))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def find_within(self, lat: float, lng: float, radius: float) -> np.ndarray:
+        """Return indices of venues within a radius in meters of a point, via the spatial index."""
+        # Straight-line (chord) length matching the great-circle radius, padded for rounding
+        chord = 2 * math.sin(min(radius / EARTH_RADIUS_M, math.pi) / 2) + 1e-9
+        phi = np.array([lat * _DEG2RAD])
+        point = _to_unit_vectors(phi, np.array([lng * _DEG2RAD]), np.cos(phi))[0]
+        return np.array(self._index.query_ball_point(point, chord), dtype=np.intp)
+
+    def distances_from(
+        self,
+        distance_to: Callable[..., np.ndarray],
+        indices: np.ndarray
+    ) -> np.ndarray:
+        """Calculate distances in meters to the given venues with a _make_distance_fn function."""
+        return distance_to(self.lat_rad[indices], self.lng_rad[indices], self.cos_lat[indices])
+
+    def to_dict(self, i: int, distance: float) -> Dict:
+        """Build the API representation of one venue, with copies the caller may modify."""
+        return {
+            "name": self.names[i],
+            "type": self.venue_types[i],
+            "coordinates": {"lat": float(self.lats[i]), "lng": float(self.lngs[i])},
+            "distance": distance,
+            "equipment": list(self.equipment[i]),
+            "features": list(self.features[i]),
+            "rating": float(self.ratings[i]),
+            "open_hours": dict(self.open_hours[i])
+        }
 
 class WorkoutPartner:
-    def __init__(self):
-        self._initialize_exercise_database()
-        self._initialize_meal_database()
-        self._initialize_venue_database()
-
-    def _initialize_exercise_database(self):
-        """Initialize sample exercises for different workout types."""
-        self.exercises_db = {
-            WorkoutType.CALISTHENICS: [
+    # Each database is built on first access and cached on the class for every instance
+    # to share, so every level is immutable: read-only mappings, tuples and frozen records
+
+    @property
+    def exercises_db(self) -> Mapping[WorkoutType, Tuple[Exercise, ...]]:
+        return self._build_exercise_database()
+
+    @property
+    def meals_db(self) -> Mapping[DietaryPreference, Mapping[str, Tuple[Meal, ...]]]:
+        return self._build_meal_database()[0]
+
+    @property
+    def _meal_calories(self) -> Mapping[DietaryPreference, Mapping[str, Tuple[int, ...]]]:
+        return self._build_meal_database()[1]
+
+    @property
+    def venues_db(self) -> Tuple[WorkoutLocation, ...]:
+        return self._build_venue_database()[0]
+
+    @property
+    def _venue_table(self) -> VenueTable:
+        return self._build_venue_database()[1]
+
+    @classmethod
+    @functools.cache
+    def _build_exercise_database(cls) -> Mapping[WorkoutType, Tuple[Exercise, ...]]:
+        """Build sample exercises for different workout types."""
+        return MappingProxyType({
+            WorkoutType.CALISTHENICS: (
                 Exercise(
                     name="Push-ups",
                     sets=3,
@@ -89,8 +241,8 @@ class WorkoutPartner:
                     rest_period=90
                 ),
                 # Add more exercises...
-            ],
-            WorkoutType.HIIT: [
+            ),
+            WorkoutType.HIIT: (
                 Exercise(
                     name="Burpees",
                     sets=None,
@@ -102,12 +254,17 @@ class WorkoutPartner:
                     rest_period=15
                 ),
                 # Add more exercises...
-            ]
-        }
-
-    def _initialize_meal_database(self):
-        """Initialize sample meals for different dietary preferences."""
-        self.meals_db = {
+            )
+        })
+
+    @classmethod
+    @functools.cache
+    def _build_meal_database(cls) -> Tuple[
+        Mapping[DietaryPreference, Mapping[str, Tuple[Meal, ...]]],
+        Mapping[DietaryPreference, Mapping[str, Tuple[int, ...]]]
+    ]:
+        """Build sample meals for different dietary preferences, with their calorie lists."""
+        meals_db = {
             DietaryPreference.BALANCED: {
                 "breakfast": [
                     Meal(
@@ -132,22 +289,41 @@ class WorkoutPartner:
             # Add more dietary preferences...
         }
 
-    def _initialize_venue_database(self):
-        """Initialize sample workout venues."""
-        self.venues_db = [
+        # Freeze each slot sorted by calories, with the calorie counts alongside,
+        # so _select_meal can binary-search for the closest meal
+        sorted_meals = {}
+        meal_calories = {}
+        for preference, slots in meals_db.items():
+            sorted_meals[preference] = {}
+            meal_calories[preference] = {}
+            for slot, slot_meals in slots.items():
+                ordered = tuple(sorted(slot_meals, key=lambda m: m.calories))
+                sorted_meals[preference][slot] = ordered
+                meal_calories[preference][slot] = tuple(m.calories for m in ordered)
+            sorted_meals[preference] = MappingProxyType(sorted_meals[preference])
+            meal_calories[preference] = MappingProxyType(meal_calories[preference])
+        return MappingProxyType(sorted_meals), MappingProxyType(meal_calories)
+
+    @classmethod
+    @functools.cache
+    def _build_venue_database(cls) -> Tuple[Tuple[WorkoutLocation, ...], VenueTable]:
+        """Build sample workout venues and the column-oriented table queries run against."""
+        venues_db = (
             WorkoutLocation(
                 name="Central Park Fitness Area",
                 venue_type="park",
                 latitude=40.7829,
                 longitude=-73.9654,
                 equipment=["pull-up bars", "parallel bars", "open turf"],
-                distance=0,  # Will be calculated based on user location
+                distance=0,  # Per-query distances are returned by suggest_workout_location
                 open_hours={"all": (time(6, 0), time(22, 0))},
                 features=["outdoor", "free", "calisthenics-friendly"],
                 rating=4.5
             ),
             # Add more venues...
-        ]
+        )
+
+        return venues_db, VenueTable(venues_db)
 
     def generate_daily_workout(
         self,
@@ -158,28 +334,27 @@ class WorkoutPartner:
     ) -> Dict:
         """Generate a daily workout routine based on user preferences."""
         # Filter exercises based on equipment access
-        available_exercises = []
-        for exercise in self.exercises_db.get(workout_type, []):
-            if all(eq in equipment_access for eq in exercise.equipment):
-                available_exercises.append(exercise)
+        access = frozenset(equipment_access)
+        available_exercises = [
+            exercise for exercise in self.exercises_db.get(workout_type, ())
+            if exercise._equipment_set <= access
+        ]
 
         # Select exercises based on time available and fitness goal
         selected_exercises = []
         total_time = 0
         target_time = time_available * 60  # Convert to seconds
 
-        while total_time < target_time and available_exercises:
-            exercise = self._select_best_exercise(
-                available_exercises,
-                fitness_goal,
-                target_time - total_time
-            )
-            if not exercise:
+        # Greedy single pass in list order: the time left only shrinks, so an exercise
+        # that doesn't fit now can never fit later and never needs revisiting
+        for exercise in available_exercises:
+            if total_time >= target_time:
                 break
 
-            selected_exercises.append(exercise)
-            total_time += self._calculate_exercise_time(exercise)
-            available_exercises.remove(exercise)
+            exercise_time = self._calculate_exercise_time(exercise)
+            if exercise_time <= target_time - total_time:
+                selected_exercises.append(exercise)
+                total_time += exercise_time
 
         return {
             "workout_plan": {
@@ -201,25 +376,33 @@ class WorkoutPartner:
     ) -> Dict:
         """Generate a daily meal plan based on user preferences."""
         meals = self.meals_db.get(dietary_preference, {})
+        calories = self._meal_calories.get(dietary_preference, {})
         selected_meals = {
-            "breakfast": self._select_meal(meals.get("breakfast", []), calorie_target * 0.3),
-            "lunch": self._select_meal(meals.get("lunch", []), calorie_target * 0.35),
-            "dinner": self._select_meal(meals.get("dinner", []), calorie_target * 0.35)
+            "breakfast": self._select_meal(
+                meals.get("breakfast", ()), calories.get("breakfast", ()), calorie_target * 0.3
+            ),
+            "lunch": self._select_meal(
+                meals.get("lunch", ()), calories.get("lunch", ()), calorie_target * 0.35
+            ),
+            "dinner": self._select_meal(
+                meals.get("dinner", ()), calories.get("dinner", ()), calorie_target * 0.35
+            )
         }
 
         if include_snacks:
             selected_meals["snacks"] = self._select_meal(
-                meals.get("snacks", []),
+                meals.get("snacks", ()),
+                calories.get("snacks", ()),
                 calorie_target * 0.1
             )
 
-        total_macros = self._calculate_total_macros(selected_meals)
+        total_macros, total_calories = self._calculate_totals(selected_meals)
         water_intake = self._calculate_water_intake(calorie_target)
 
         return {
             "meal_plan": selected_meals,
             "macros": total_macros,
-            "total_calories": sum(meal.calories for meal in selected_meals.values()),
+            "total_calories": total_calories,
             "water_intake_ml": water_intake
         }
 
@@ -232,86 +415,32 @@ class WorkoutPartner:
         max_distance: float = 5000  # 5km default radius
     ) -> List[Dict]:
         """Suggest workout locations based on user location and preferences."""
-        # Calculate distances and filter venues
-        ranked_venues = []
-        for venue in self.venues_db:
-            # Calculate distance using Haversine formula
-            distance = self._calculate_distance(
-                user_lat, user_lng,
-                venue.latitude, venue.longitude
-            )
-            
-            if distance <= max_distance:
-                # Check if venue has required equipment
-                if all(eq in venue.equipment for eq in required_equipment):
-                    venue.distance = distance
-                    ranked_venues.append(venue)
-
-        # Sort venues by distance and relevance
-        ranked_venues.sort(key=lambda x: (
-            x.distance,
-            -len(set(x.features) & self._get_workout_type_features(workout_type)),
-            -x.rating
+        venues = self._venue_table
+
+        # Look up nearby venues in the spatial index, then calculate exact distances for them
+        candidates = venues.find_within(user_lat, user_lng, max_distance)
+        distances = venues.distances_from(_make_distance_fn(user_lat, user_lng), candidates)
+        required = frozenset(required_equipment)
+        matches = []
+        for i, distance in zip(candidates, distances):
+            # Check if venue is in range and has required equipment
+            if distance <= max_distance and required <= venues.equipment_sets[i]:
+                matches.append((float(distance), i))
+
+        # Rank venues by distance and relevance; only the top 5 need ordering
+        target_features = self._get_workout_type_features(workout_type)
+        top_matches = heapq.nsmallest(5, matches, key=lambda m: (
+            m[0],
+            -len(venues.feature_sets[m[1]] & target_features),
+            -venues.ratings[m[1]]
         ))
 
         # Return top 5 venues
-        return [{
-            "name": venue.name,
-            "type": venue.venue_type,
-            "coordinates": {"lat": venue.latitude, "lng": venue.longitude},
-            "distance": venue.distance,
-            "equipment": venue.equipment,
-            "features": venue.features,
-            "rating": venue.rating,
-            "open_hours": venue.open_hours
-        } for venue in ranked_venues[:5]]
-
-    def _calculate_distance(
-        self,
-        lat1: float,
-        lon1: float,
-        lat2: float,
-        lon2: float
-    ) -> float:
-        """Calculate distance between two points using Haversine formula."""
-        R = 6371000  # Earth's radius in meters
-
-        phi1 = math.radians(lat1)
-        phi2 = math.radians(lat2)
-        delta_phi = math.radians(lat2 - lat1)
-        delta_lambda = math.radians(lon2 - lon1)
-
-        a = math.sin(delta_phi/2) * math.sin(delta_phi/2) + \
-            math.cos(phi1) * math.cos(phi2) * \
-            math.sin(delta_lambda/2) * math.sin(delta_lambda/2)
-        
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-        return R * c
-
-    def _get_workout_type_features(self, workout_type: WorkoutType) -> set:
-        """Get relevant features for a workout type."""
-        feature_map = {
-            WorkoutType.CALISTHENICS: {"outdoor", "calisthenics-friendly", "free"},
-            WorkoutType.GYM_BASED: {"indoor", "equipment-rich", "climate-controlled"},
-            WorkoutType.HIIT: {"open space", "climate-controlled", "equipment-optional"},
-            WorkoutType.STRENGTH: {"equipment-rich", "weights-available"},
-            WorkoutType.CARDIO: {"running-track", "cardio-equipment", "open space"},
-            WorkoutType.FLEXIBILITY: {"quiet", "spacious", "climate-controlled"}
-        }
-        return feature_map.get(workout_type, set())
+        return [venues.to_dict(i, distance) for distance, i in top_matches]
 
-    def _select_best_exercise(
-        self,
-        exercises: List[Exercise],
-        goal: FitnessGoal,
-        time_remaining: int
-    ) -> Optional[Exercise]:
-        """Select the best exercise based on goal and time constraints."""
-        for exercise in exercises:
-            time_needed = self._calculate_exercise_time(exercise)
-            if time_needed <= time_remaining:
-                return exercise
-        return None
+    def _get_workout_type_features(self, workout_type: WorkoutType) -> FrozenSet[str]:
+        """Get relevant features for a workout type."""
+        return _WORKOUT_TYPE_FEATURES.get(workout_type, frozenset())
 
     def _calculate_exercise_time(self, exercise: Exercise) -> int:
         """Calculate total time needed for an exercise including rest."""
@@ -322,34 +451,67 @@ class WorkoutPartner:
 
     def _calculate_workout_intensity(self, exercises: List[Exercise]) -> str:
         """Calculate overall workout intensity."""
-        intensity_scores = {"low": 1, "moderate": 2, "high": 3}
-        avg_intensity = sum(intensity_scores[ex.intensity] for ex in exercises) / len(exercises)
+        if not exercises:
+            return "low"
+
+        avg_intensity = _INTENSITY_SCORES[self._intensity_codes(exercises)].mean()
         return "high" if avg_intensity > 2.5 else "moderate" if avg_intensity > 1.5 else "low"
 
     def _estimate_calories_burned(self, exercises: List[Exercise]) -> int:
         """Estimate calories burned during workout."""
         # Simplified calculation - would need to account for user's weight and other factors
-        intensity_multipliers = {"low": 3, "moderate": 5, "high": 7}
-        total_calories = 0
-        for exercise in exercises:
-            time_in_minutes = self._calculate_exercise_time(exercise) / 60
-            total_calories += time_in_minutes * intensity_multipliers[exercise.intensity]
-        return int(total_calories)
-
-    def _select_meal(self, meals: List[Meal], target_calories: float) -> Optional[Meal]:
-        """Select appropriate meal based on calorie target."""
+        times_in_seconds = np.fromiter(
+            (self._calculate_exercise_time(exercise) for exercise in exercises),
+            dtype=np.float64,
+            count=len(exercises)
+        )
+        multipliers = _INTENSITY_CALORIES_PER_MINUTE[self._intensity_codes(exercises)]
+        # Sum whole seconds x rate first and convert to minutes once, avoiding per-term rounding
+        return int(np.dot(times_in_seconds, multipliers) / 60)
+
+    def _intensity_codes(self, exercises: List[Exercise]) -> np.ndarray:
+        """Collect the intensity codes of exercises into an index array."""
+        return np.fromiter(
+            (exercise._intensity_code for exercise in exercises),
+            dtype=np.intp,
+            count=len(exercises)
+        )
+
+    def _select_meal(
+        self,
+        meals: Sequence[Meal],
+        meal_calories: Sequence[int],
+        target_calories: float
+    ) -> Optional[Meal]:
+        """Select appropriate meal based on calorie target.
+
+        meals must be sorted by calories, with meal_calories holding their calorie counts.
+        """
         if not meals:
             return None
-        return min(meals, key=lambda m: abs(m.calories - target_calories))
 
-    def _calculate_total_macros(self, meals: Dict[str, Meal]) -> Dict[str, float]:
-        """Calculate total macronutrients from selected meals."""
-        totals = {"protein": 0, "carbs": 0, "fats": 0}
+        # Closest meal is either the first at/above the target or the one just below it
+        i = bisect_left(meal_calories, target_calories)
+        if i > 0 and (
+            i == len(meals) or
+            target_calories - meal_calories[i - 1] <= meal_calories[i] - target_calories
+        ):
+            # Step back to the first meal with that lower calorie count
+            i = bisect_left(meal_calories, meal_calories[i - 1])
+        return meals[i]
+
+    def _calculate_totals(self, meals: Dict[str, Optional[Meal]]) -> Tuple[Dict[str, float], int]:
+        """Calculate total macronutrients and calories from selected meals in one pass."""
+        protein = carbs = fats = calories = 0
         for meal in meals.values():
-            if meal:
-                for macro, value in meal.macros.items():
-                    totals[macro] += value
-        return totals
+            if meal is None:
+                continue
+            macros = meal.macros
+            protein += macros.get("protein", 0)
+            carbs += macros.get("carbs", 0)
+            fats += macros.get("fats", 0)
+            calories += meal.calories
+        return {"protein": protein, "carbs": carbs, "fats": fats}, calories
 
     def _calculate_water_intake(self, calorie_target: int) -> int:
         """Calculate recommended daily water intake in milliliters."""